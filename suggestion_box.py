@@ -15,7 +15,7 @@ Features:
   Work Process, or Benefits based on keywords, making it easier to identify patterns and prioritize action.
 - Employees can also submit anonymous questions, view previously submitted questions, and 
   add multiple answers collaboratively, promoting transparency and shared knowledge.
-- All suggestions and questions are saved persistently to text files (using JSON format for suggestions) 
+- All suggestions and questions are saved persistently to text files (one JSON object per line) 
   so the feedback remains available across program restarts, ensuring no data loss.
 - An admin mode, protected by password, allows authorized personnel to view summaries, manage data, 
   and delete all stored feedback when necessary — adding a layer of security and control.
@@ -25,18 +25,19 @@ Features:
 
 APIs Used:
 - langdetect: Detects the language of input text  
-- googletrans: Translates non-English input to English  
-- TextBlob: Performs sentiment analysis on suggestions
+- Google Translate web endpoint (via requests): Translates non-English input to English  
+
+Sentiment analysis uses a small built-in word lexicon, so no NLP corpora are needed. If TextBlob
+happens to be installed, its larger lexicon file is read as well (TextBlob itself is not imported).
 
 How to Run:
 1. Ensure Python 3 is installed.  
 2. Install dependencies with:  
-   pip install langdetect googletrans==4.0.0rc1 textblob  
-3. Download required TextBlob corpora:  
-   python -m textblob.download_corpora  
-4. Run the program:  
+   pip install langdetect requests  
+   (optional, faster loading of saved data: pip install orjson)  
+3. Run the program:  
    python suggestion_box.py  
-5. Use the on-screen menu to submit/view suggestions and questions or enter admin mode.
+4. Use the on-screen menu to submit/view suggestions and questions or enter admin mode.
 
 Author: Ishwor Tandon
 Date: May 21st 2025
@@ -44,170 +45,654 @@ Date: May 21st 2025
 
 import random
 import json
-from langdetect import detect
-from googletrans import Translator
-from textblob import TextBlob
+import functools
+import unicodedata
+import re
+from array import array
+from collections import defaultdict
 import os
+import importlib.util
+import xml.etree.ElementTree as ElementTree
+import mmap
 import getpass
-
-translator = Translator()
+import atexit
+import hashlib
+import hmac
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson parses and writes JSON several times faster when installed; the standard json module works too
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_line(obj):
+        """Encode obj as one line of UTF-8 JSON bytes, newline included."""
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_line(obj):
+        """Encode obj as one line of UTF-8 JSON bytes, newline included."""
+        return json.dumps(obj).encode() + b"\n"
 
 # Data storage
-suggestions = []  # Each element: {'text': "...", 'sentiment': "Positive"/"Neutral"/"Negative"}
-questions = {}    # dict: question -> list of answers
+# Suggestions are kept as parallel lists: index i is one suggestion
+suggestion_texts = []       # English text of each suggestion
+suggestion_sentiments = []  # "Positive"/"Neutral"/"Negative" ("Unknown" for old entries without one)
+questions = {}    # dict: normalized question -> {'display': "...", 'answers': [...]}
 
 # Categorization
-categories = {
-    "Facility": [],
-    "Work Process": [],
-    "Benefits": [],
-    "Other": []
-}
-
 category_keywords = {
     "Facility": ["office", "room", "desk", "chair", "light", "building"],
     "Work Process": ["workflow", "schedule", "process", "meeting", "task", "communication"],
     "Benefits": ["bonus", "leave", "health", "insurance", "raise", "salary"]
 }
 
+# Categories are stored as small integer codes indexing CATEGORY_NAMES
+CATEGORY_NAMES = (*category_keywords, "Other")
+OTHER = len(CATEGORY_NAMES) - 1
+category_of = array('b')  # category code of each suggestion, aligned with suggestion_texts
+category_members = defaultdict(list)  # dict: category code -> indices of its suggestions
+
+# Sentiment lexicon: word -> polarity from -1.0 (very negative) to 1.0 (very positive).
+# A text's polarity is the average over the words found here, as TextBlob does.
+_SENT_LEX = {
+    # positive
+    "good": 0.7, "great": 0.8, "excellent": 1.0, "amazing": 0.6, "awesome": 1.0,
+    "fantastic": 0.4, "wonderful": 1.0, "perfect": 1.0, "best": 1.0, "better": 0.5,
+    "nice": 0.6, "fine": 0.4, "happy": 0.8, "glad": 0.5, "pleased": 0.5,
+    "love": 0.5, "loved": 0.7, "like": 0.2, "enjoy": 0.4, "enjoyed": 0.4,
+    "appreciate": 0.4, "appreciated": 0.4, "thanks": 0.2, "thank": 0.2, "grateful": 0.6,
+    "helpful": 0.5, "useful": 0.3, "friendly": 0.4, "kind": 0.6, "supportive": 0.5,
+    "clean": 0.4, "comfortable": 0.4, "quiet": 0.1, "bright": 0.7, "modern": 0.2,
+    "fast": 0.2, "quick": 0.3, "efficient": 0.4, "easy": 0.4, "smooth": 0.4,
+    "clear": 0.1, "fair": 0.7, "flexible": 0.3, "generous": 0.5, "safe": 0.5,
+    "productive": 0.4, "positive": 0.2, "improve": 0.3, "improved": 0.3, "improvement": 0.3,
+    "fun": 0.3, "exciting": 0.3, "interesting": 0.5, "impressive": 0.8, "beautiful": 0.9,
+    "well": 0.3, "welcome": 0.8, "satisfied": 0.5, "effective": 0.6, "reliable": 0.5,
+    "calm": 0.3, "pleasant": 0.7, "valuable": 0.5, "wise": 0.7, "smart": 0.2,
+    "brilliant": 0.9, "superb": 1.0, "outstanding": 0.5, "encouraging": 0.4, "motivated": 0.4,
+    # negative
+    "bad": -0.7, "terrible": -1.0, "awful": -1.0, "horrible": -1.0, "worst": -1.0,
+    "worse": -0.4, "poor": -0.4, "sad": -0.5, "unhappy": -0.6, "angry": -0.5,
+    "upset": -0.4, "annoying": -0.8, "annoyed": -0.4, "frustrating": -0.4, "frustrated": -0.7,
+    "hate": -0.8, "dislike": -0.4, "disappointed": -0.75, "disappointing": -0.6, "boring": -1.0,
+    "broken": -0.4, "dirty": -0.6, "noisy": -0.3, "loud": -0.2, "dark": -0.15,
+    "cold": -0.6, "hot": -0.25, "small": -0.25, "crowded": -0.3, "uncomfortable": -0.5,
+    "slow": -0.3, "late": -0.3, "long": -0.05, "hard": -0.3, "difficult": -0.5,
+    "stressful": -0.5, "stressed": -0.5, "tired": -0.4, "unfair": -0.5, "unclear": -0.3,
+    "confusing": -0.3, "confused": -0.4, "useless": -0.5, "wrong": -0.5, "unsafe": -0.5,
+    "expensive": -0.5, "low": -0.1, "lack": -0.3, "missing": -0.2, "never": -0.1,
+    "problem": -0.3, "problems": -0.3, "issue": -0.2, "issues": -0.2, "complaint": -0.4,
+    "unacceptable": -0.8, "ridiculous": -0.3, "rude": -0.7, "toxic": -0.6, "lazy": -0.25,
+    "messy": -0.4, "ugly": -0.7, "stupid": -0.8, "painful": -0.7, "sick": -0.7,
+    "waste": -0.4, "wasted": -0.4, "fail": -0.5, "failed": -0.5, "failure": -0.5,
+}
+_sentiment_lexicon = None  # _SENT_LEX merged with TextBlob's full lexicon if available, built on first use
+_NEGATIONS = frozenset({"not", "no", "never", "nor", "cannot"})
+_WORD_RE = re.compile(r"[a-z']+")
+
+# All keywords in one compiled pattern, so a suggestion is scanned in a single pass.
+# Keywords match whole words, plus a plural "s" or "es", so "meetings" matches "meeting"
+# and "processes" matches "process", but "office" does not match inside "officer".
+# dict: keyword -> category code; built in reverse so the first category listing a keyword wins
+_KEYWORD_CATEGORY = {
+    keyword: code
+    for code, keywords in reversed(list(enumerate(category_keywords.values())))
+    for keyword in keywords
+}
+_KEYWORD_RE = re.compile(
+    r"\b(" + "|".join(map(re.escape, _KEYWORD_CATEGORY)) + r")(?:e?s)?\b",
+    re.IGNORECASE,
+)
+
 # Files
 SUGGESTIONS_FILE = "suggestions.txt"
-QUESTIONS_FILE = "questions.txt"
-
-# Admin password (change as desired)
-ADMIN_PASSWORD = "admin123"
+QUESTIONS_FILE = "questions.jsonl"      # append-only log of {"q": question, "a": [answers]} records
+LEGACY_QUESTIONS_FILE = "questions.txt" # older Q:/A:/--- format, read if QUESTIONS_FILE is missing
+TRANSLATION_CACHE_FILE = ".translation_cache.jsonl"  # detected languages and translations, one record per line
+
+# Append-only files (suggestions, translation cache) are opened once and kept open.
+# dict: path -> binary append handle; writes are buffered until flush_files()
+_append_handles = {}
+APPEND_BUFFER_SIZE = 1 << 16
+
+# Admin password, stored only as a salted PBKDF2-SHA256 hash. To change it, generate a new pair with:
+#   python -c "import hashlib, os; s = os.urandom(16); print(s.hex());
+#              print(hashlib.pbkdf2_hmac('sha256', b'NEW PASSWORD', s, 200_000).hex())"
+ADMIN_SALT = bytes.fromhex("14809ac38eeecd68183af796f223a202")
+ADMIN_PASSWORD_HASH = bytes.fromhex("928b8347ec234c8b25d305746df96af17023e6c46bf6945382d70cc913ae1208")
+ADMIN_HASH_ITERATIONS = 200_000
+
+def _hash_password(password):
+    """Salted, deliberately slow hash of a password, comparable with ADMIN_PASSWORD_HASH."""
+    return hashlib.pbkdf2_hmac("sha256", password.encode(), ADMIN_SALT, ADMIN_HASH_ITERATIONS)
+
+# Submissions waiting to be translated in one batch.
+# Each element: ("suggestion" or "question", raw text as typed)
+_pending = []
+PENDING_BATCH_SIZE = 10  # flush early once this many submissions are queued
+
+# Languages and translations already worked out, so repeated text skips langdetect and
+# the network round-trip. Both are keyed by _cache_key(text) and persisted in TRANSLATION_CACHE_FILE.
+_detect_cache = {}       # dict: key -> language code
+_translation_cache = {}  # dict: key -> English text
+TRANSLATION_WORKERS = 16       # translation requests allowed in flight at once, across all threads
+TRANSLATION_CHUNK_SIZE = 50    # texts joined into one request; keeps requests under the service's size limit
+TRANSLATION_CHUNK_WORKERS = 8  # joined requests allowed in flight at once for large (bulk) batches
+TRANSLATE_URL = "https://translate.googleapis.com/translate_a/single"
+TRANSLATE_TIMEOUT = 5          # seconds to wait for one translation reply
+# Caps the requests in flight across all threads, matching the session's connection pool
+_request_slots = threading.BoundedSemaphore(TRANSLATION_WORKERS)
+_exiting = False  # set by the atexit hook, after which no new threads can be started
+
+# Common English words; plain ASCII text containing any of them skips language detection...
+_EN_STOPWORDS = frozenset({"the", "a", "is", "and", "to", "of", "in", "for", "it"})
+# ...unless it also contains a common Spanish/French/German/Italian/Portuguese/Dutch word,
+# as in unaccented "voy a la oficina"
+_NON_ENGLISH_HINT_RE = re.compile(
+    r"\b(?:el|la|los|las|que|del|y|es|por|para|pero|muy|como|le|les|une|est|avec|pour|mais"
+    r"|sont|und|der|das|ist|nicht|ich|mit|auch|sehr|il|che|della|sono|uma|nao|het|een|niet)\b",
+    re.IGNORECASE,
+)
 
 # ------------------- File I/O -------------------
 
+def _read_raw_lines(path):
+    """Return the lines of path as UTF-8 bytes without line endings, read via a memory map."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return [line.rstrip(b"\r\n") for line in iter(mm.readline, b"")]
+
+def _load_json_lines(path, kind):
+    """Parse a JSON-lines file into a list of objects, skipping invalid lines with a warning."""
+    lines = [line for line in _read_raw_lines(path) if line.strip()]
+    # Fast path: parse the whole file as one JSON array in a single call.
+    # (JSON and Unicode decode errors from both json and orjson are ValueErrors.)
+    try:
+        records = _json_loads(b"[" + b",".join(lines) + b"]")
+        if len(records) == len(lines):
+            return records
+    except ValueError:
+        pass
+    records = []
+    for line in lines:
+        try:
+            records.append(_json_loads(line))
+        except ValueError:
+            print(f"[Warning] Skipping invalid {kind} entry in file.")
+    return records
+
 def load_suggestions():
     """Load saved suggestions from file (JSON lines) and categorize."""
     if os.path.exists(SUGGESTIONS_FILE):
-        with open(SUGGESTIONS_FILE, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        suggestion_entry = json.loads(line)
-                        suggestions.append(suggestion_entry)
-                        categorize_suggestion(suggestion_entry['text'])
-                    except json.JSONDecodeError:
-                        print("[Warning] Skipping invalid suggestion entry in file.")
+        categorize_suggestions(_load_json_lines(SUGGESTIONS_FILE, "suggestion"))
+
+def _append(path, data):
+    """Append bytes to path through its long-lived buffered handle."""
+    fh = _append_handles.get(path)
+    if fh is None:
+        fh = _append_handles[path] = open(path, "ab", buffering=APPEND_BUFFER_SIZE)
+    fh.write(data)
+
+def flush_files():
+    """Write any buffered appends out to their files."""
+    for fh in _append_handles.values():
+        fh.flush()
+
+def _flush_file(path):
+    """Write out the buffered appends of one file, if it has an open handle."""
+    fh = _append_handles.get(path)
+    if fh is not None:
+        fh.flush()
+
+def _close_files():
+    """Flush, sync to disk and close every append handle."""
+    for fh in _append_handles.values():
+        fh.flush()
+        os.fsync(fh.fileno())
+        fh.close()
+    _append_handles.clear()
 
 def save_suggestion(suggestion):
-    """Append a suggestion dict as a JSON string to the suggestions file."""
-    with open(SUGGESTIONS_FILE, "a", encoding="utf-8") as f:
-        f.write(json.dumps(suggestion) + "\n")
+    """Append a suggestion dict as a JSON string to the (buffered) suggestions file."""
+    _append(SUGGESTIONS_FILE, _json_line(suggestion))
+
+def _atomic_write(path, lines):
+    """Write lines (bytes) to a temporary file and swap it into place, so path is never half written."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.writelines(lines)
+    os.replace(tmp_path, path)
+
+def _normalize_question(question):
+    """Key used to spot duplicate questions regardless of case and spacing."""
+    return " ".join(question.lower().split())
+
+def _add_loaded_question(question, answers):
+    """Merge a question read from file into memory."""
+    entry = questions.setdefault(_normalize_question(question), {'display': question, 'answers': []})
+    entry['answers'].extend(answers)
+
+def _load_legacy_questions():
+    """Read questions saved in the older Q:/A:/--- text format."""
+    with open(LEGACY_QUESTIONS_FILE, "r", encoding="utf-8") as f:
+        content = f.read()
+    # Each block is a "Q: ..." line followed by any number of "A: ..." lines
+    for block in content.split("\n---\n"):
+        lines = [line.strip() for line in block.splitlines()]
+        if not lines or not lines[0].startswith("Q: "):
+            continue
+        answers = [line[3:] for line in lines[1:] if line.startswith("A: ")]
+        _add_loaded_question(lines[0][3:], answers)
+
+def _replay_questions():
+    """Rebuild questions by merging every record of the log in order."""
+    for entry in _load_json_lines(QUESTIONS_FILE, "question"):
+        try:
+            _add_loaded_question(entry['q'], entry['a'])
+        except KeyError:
+            print("[Warning] Skipping invalid question entry in file.")
 
 # Load questions and answers from file into memory.
 def load_questions():
     if os.path.exists(QUESTIONS_FILE):
-        with open(QUESTIONS_FILE, "r", encoding="utf-8") as f:
-            current_question = None
-            for line in f:
-                line = line.strip()
-                if line.startswith("Q: "):
-                    current_question = line[3:]
-                    if current_question not in questions:
-                        questions[current_question] = []
-                elif line.startswith("A: ") and current_question is not None:
-                    questions[current_question].append(line[3:])
-                elif line == "---":
-                    current_question = None
-
-# Append question and optional answer to file.
+        _replay_questions()
+    elif os.path.exists(LEGACY_QUESTIONS_FILE):
+        _load_legacy_questions()
+        # Migrate right away: later saves only append to QUESTIONS_FILE
+        compact_questions()
+
 def save_question(question, answer=None):
-    with open(QUESTIONS_FILE, "a", encoding="utf-8") as f:
-        f.write(f"Q: {question}\n")
-        if answer is not None:
-            f.write(f"A: {answer}\n")
-        f.write("---\n")
+    """Append one record to the questions log: a new question, or an answer to an existing one."""
+    record = {"q": question, "a": [] if answer is None else [answer]}
+    _append(QUESTIONS_FILE, _json_line(record))
+
+def compact_questions():
+    """Rewrite the questions log with a single record per question."""
+    # The append handle would keep pointing at the replaced file
+    _close_files()
+    _atomic_write(QUESTIONS_FILE, [
+        _json_line({"q": entry['display'], "a": entry['answers']})
+        for entry in questions.values()
+    ])
+
+def load_translation_cache():
+    """Load remembered language detections and translations from file."""
+    if os.path.exists(TRANSLATION_CACHE_FILE):
+        for record in _load_json_lines(TRANSLATION_CACHE_FILE, "translation cache"):
+            try:
+                if 'lang' in record:
+                    _detect_cache[record['key']] = record['lang']
+                if 'text' in record:
+                    _translation_cache[record['key']] = record['text']
+            except KeyError:
+                print("[Warning] Skipping invalid translation cache entry in file.")
+
+def _save_cache_records(records):
+    """Append new cache records (dicts) to the translation cache file."""
+    if records:
+        _append(TRANSLATION_CACHE_FILE, b"".join(map(_json_line, records)))
 
 def delete_all_data():
     """ Delete all stored suggestions and questions files and clear memory. """
-    global suggestions, questions, categories
-    suggestions.clear()
+    _clear_suggestions()
     questions.clear()
-    for cat in categories:
-        categories[cat].clear()
-    if os.path.exists(SUGGESTIONS_FILE):
-        os.remove(SUGGESTIONS_FILE)
-    if os.path.exists(QUESTIONS_FILE):
-        os.remove(QUESTIONS_FILE)
+    # The cache holds the submitted texts too, so it goes with the rest of the data
+    _detect_cache.clear()
+    _translation_cache.clear()
+    _close_files()
+    for path in (SUGGESTIONS_FILE, QUESTIONS_FILE, LEGACY_QUESTIONS_FILE, TRANSLATION_CACHE_FILE):
+        if os.path.exists(path):
+            os.remove(path)
     print("All suggestions and questions deleted.")
 
 # ------------------- Core Features -------------------
 
-def detect_and_translate(text):
-    """Detect language and translate to English if needed."""
+# langdetect and requests are slow to import, so they are only loaded once something
+# actually needs detecting or translating (viewing summaries or questions never does)
+
+def _detect_language(text):
+    """Return the language code langdetect finds for text."""
+    from langdetect import detect
+    return detect(text)
+
+@functools.cache
+def _get_session():
+    """Create the HTTP session used for translation on first use and reuse it afterwards."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    session = requests.Session()
+    # Keep connections alive, with room for every translation thread
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=TRANSLATION_WORKERS))
+    return session
+
+def _translate_direct(text, dest='en'):
+    """Translate text to dest with one request to the translate endpoint; raises on failure."""
+    # The text goes in the request body, so joined batches are not limited by URL length
+    with _request_slots:
+        reply = _get_session().post(
+            TRANSLATE_URL,
+            # The service detects the source itself; langdetect's guess on short texts is too unreliable to force
+            params={"client": "gtx", "sl": "auto", "tl": dest, "dt": "t"},
+            data={"q": text},
+            timeout=TRANSLATE_TIMEOUT,
+        )
+    reply.raise_for_status()
+    # Reply is [[[translated, original, ...], ...], ...]: one entry per sentence, newlines included
+    return "".join(segment[0] for segment in reply.json()[0] if segment[0])
+
+def _cache_key(text):
+    """Key for the translation caches, so trivially different spellings share an entry."""
+    return unicodedata.normalize("NFC", text.strip().lower())
+
+def _likely_english(text):
+    """Cheap check for plain ASCII English, used before running langdetect."""
+    return (
+        text.isascii()
+        and not _EN_STOPWORDS.isdisjoint(text.lower().split())
+        and not _NON_ENGLISH_HINT_RE.search(text)
+    )
+
+def _map_in_threads(func, items, max_workers):
+    """Return list(map(func, items)), overlapped in up to max_workers threads unless the program is exiting."""
+    if _exiting or max_workers <= 1:
+        return list(map(func, items))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, items))
+
+def _translate_one(text):
+    """Translate one text to English; returns None if the request fails."""
     try:
-        lang = detect(text)
-        if lang != 'en':
-            translated = translator.translate(text, dest='en')
-            return translated.text
-        else:
-            return text
+        return _translate_direct(text)
     except Exception as e:
-        print(f"[Warning] Language detection/translation failed: {e}")
-        return text
+        print(f"[Warning] Translation failed: {e}")
+        return None
 
-def analyze_sentiment(text):
-    """Return sentiment classification of text."""
+def _translate_joined(texts):
+    """Translate several single-line texts in one request by joining them with newlines.
+
+    Returns the translations in order (all None if the request failed), or None if the
+    reply does not split back into one line per text.
+    """
+    if any("\n" in text for text in texts):
+        return None
     try:
-        polarity = TextBlob(text).sentiment.polarity
-        if polarity > 0.1:
-            return "Positive"
-        elif polarity < -0.1:
-            return "Negative"
-        else:
-            return "Neutral"
+        reply = _translate_direct("\n".join(texts))
+    except Exception as e:
+        # Retrying text by text would only multiply the requests to a service that is failing
+        print(f"[Warning] Batch translation failed: {e}")
+        return [None] * len(texts)
+    lines = reply.split("\n")
+    return lines if len(lines) == len(texts) else None
+
+def _translate_chunk(texts):
+    """Translate up to TRANSLATION_CHUNK_SIZE texts; returns a list aligned with texts (None where it failed)."""
+    if len(texts) == 1:
+        return [_translate_one(texts[0])]
+    joined = _translate_joined(texts)
+    if joined is not None:
+        return joined
+    # The joined reply did not line up: one request per text, overlapped in threads
+    return _map_in_threads(_translate_one, texts, min(TRANSLATION_WORKERS, len(texts)))
+
+def _translate_texts(texts):
+    """Translate distinct texts to English; returns a list aligned with texts (None where it failed)."""
+    try:
+        _get_session()  # create it once here rather than racing in the worker threads
     except Exception as e:
-        print(f"[Warning] Sentiment analysis failed: {e}")
+        print(f"[Warning] Translation failed: {e}")
+        return [None] * len(texts)
+    if len(texts) <= TRANSLATION_CHUNK_SIZE:
+        return _translate_chunk(texts)
+    # Bulk batches (e.g. re-processing every suggestion): send several joined requests at once
+    chunks = [texts[i:i + TRANSLATION_CHUNK_SIZE] for i in range(0, len(texts), TRANSLATION_CHUNK_SIZE)]
+    chunk_results = _map_in_threads(_translate_chunk, chunks, min(TRANSLATION_CHUNK_WORKERS, len(chunks)))
+    return [result for chunk in chunk_results for result in chunk]
+
+def detect_and_translate_batch(texts):
+    """Detect language of each text and translate all non-English ones to English, one request per language."""
+    results = list(texts)
+    to_translate = {}  # dict: language -> {cache key: first text seen with that key}
+    pending = []       # (index into texts, cache key) waiting for translation
+    new_records = []
+    for i, text in enumerate(texts):
+        if _likely_english(text):
+            continue
+        key = _cache_key(text)
+        if key in _translation_cache:
+            results[i] = _translation_cache[key]
+            continue
+        lang = _detect_cache.get(key)
+        if lang is None:
+            try:
+                lang = _detect_language(text)
+            except Exception as e:
+                print(f"[Warning] Language detection failed: {e}")
+                continue
+            _detect_cache[key] = lang
+            new_records.append({"key": key, "lang": lang})
+        if lang != 'en':
+            to_translate.setdefault(lang, {}).setdefault(key, text)
+            pending.append((i, key))
+    if to_translate:
+        # Texts are joined per detected language, so a joined request never mixes languages.
+        # Each distinct text is translated once, even if it was submitted several times.
+        for group in to_translate.values():
+            for key, result in zip(group, _translate_texts(list(group.values()))):
+                # A reply identical to the input was not really translated; leave it uncached so it is retried
+                if result is not None and _cache_key(result) != key:
+                    _translation_cache[key] = result
+                    new_records.append({"key": key, "text": result})
+        for i, key in pending:
+            results[i] = _translation_cache.get(key, texts[i])
+    _save_cache_records(new_records)
+    return results
+
+def _load_textblob_lexicon():
+    """Read TextBlob's en-sentiment.xml, if TextBlob is installed, as word -> average polarity.
+
+    Only the data file is read; TextBlob itself (and NLTK) is never imported.
+    """
+    spec = importlib.util.find_spec("textblob")
+    if spec is None or not spec.submodule_search_locations:
+        return {}
+    path = os.path.join(spec.submodule_search_locations[0], "en", "en-sentiment.xml")
+    if not os.path.exists(path):
+        return {}
+    polarities = {}  # dict: word -> polarity of each of its senses
+    try:
+        for word in ElementTree.parse(path).getroot().iter("word"):
+            form = word.get("form", "").lower()
+            if form and word.get("polarity") is not None:
+                polarities.setdefault(form, []).append(float(word.get("polarity")))
+    except (ElementTree.ParseError, ValueError) as e:
+        print(f"[Warning] Could not read TextBlob sentiment lexicon: {e}")
+        return {}
+    # TextBlob scores a word by averaging the polarity of its senses
+    return {form: sum(values) / len(values) for form, values in polarities.items()}
+
+def _get_sentiment_lexicon():
+    """Return the sentiment lexicon, building it on first use."""
+    global _sentiment_lexicon
+    if _sentiment_lexicon is None:
+        _sentiment_lexicon = {**_SENT_LEX, **_load_textblob_lexicon()}
+    return _sentiment_lexicon
+
+def analyze_sentiment(text):
+    """Return sentiment classification of text."""
+    return _classify_sentiment(text, _get_sentiment_lexicon())
+
+def analyze_sentiments(texts):
+    """Return the sentiment classification of each text, e.g. when re-processing every suggestion."""
+    lexicon = _get_sentiment_lexicon()
+    results = {}  # dict: text -> classification, so repeated texts are scored once
+    for text in texts:
+        if text not in results:
+            results[text] = _classify_sentiment(text, lexicon)
+    return [results[text] for text in texts]
+
+def _classify_sentiment(text, lexicon):
+    """Classify text as Positive, Negative or Neutral by its average word polarity."""
+    # A negation ("not", "isn't", ...) flips and halves the next sentiment word, like TextBlob
+    total = 0.0
+    count = 0
+    negate = False
+    lookup = lexicon.get
+    for word in _WORD_RE.findall(text.lower()):
+        if word in _NEGATIONS or word.endswith("n't"):
+            negate = True
+            continue
+        score = lookup(word)
+        if score is not None:
+            total += -0.5 * score if negate else score
+            count += 1
+            negate = False
+    polarity = total / count if count else 0.0
+    if polarity > 0.1:
+        return "Positive"
+    elif polarity < -0.1:
+        return "Negative"
+    else:
         return "Neutral"
 
-def categorize_suggestion(text):
-    """Categorize suggestion and store it in categories dict."""
-    text_lower = text.lower()
-    for category, keywords in category_keywords.items():
-        if any(k in text_lower for k in keywords):
-            categories[category].append({'text': text})
-            return category
-    categories["Other"].append({'text': text})
-    return "Other"
+@functools.lru_cache(maxsize=4096)
+def _match_category(text):
+    """Return the code of the category whose keywords appear in text, or OTHER."""
+    # When keywords of several categories appear, the one listed first (lowest code) wins
+    return min(
+        (_KEYWORD_CATEGORY[match.group(1).lower()] for match in _KEYWORD_RE.finditer(text)),
+        default=OTHER,
+    )
+
+def _clear_suggestions():
+    """Forget every suggestion held in memory."""
+    suggestion_texts.clear()
+    suggestion_sentiments.clear()
+    del category_of[:]
+    category_members.clear()
+
+def categorize_suggestion(entry):
+    """Categorize a suggestion entry and store its text, sentiment and category; returns the category code."""
+    categorize_suggestions([entry])
+    return category_of[-1]
+
+def categorize_suggestions(entries):
+    """Categorize and store many suggestion entries at once, e.g. when loading the file."""
+    texts = [entry['text'] for entry in entries]
+    start = len(suggestion_texts)
+    suggestion_texts.extend(texts)
+    suggestion_sentiments.extend(entry.get('sentiment', 'Unknown') for entry in entries)
+    # map + array drive the loop from C and grow category_of once
+    codes = array('b', map(_match_category, texts))
+    category_of.extend(codes)
+    for index, code in enumerate(codes, start):
+        category_members[code].append(index)
 
 def add_suggestion():
+    """Queue an anonymous suggestion for batched translation."""
     original = input("Enter your anonymous suggestion: ")
-    translated = detect_and_translate(original)
+    _pending.append(("suggestion", original))
+    print("Suggestion received.")
+    if len(_pending) >= PENDING_BATCH_SIZE:
+        flush_pending()
+
+def add_suggestions_bulk():
+    """Read several anonymous suggestions, one per line, and translate them as one batch."""
+    print("Enter your anonymous suggestions, one per line. Leave a line empty to finish.")
+    count = 0
+    while True:
+        line = input("> ")
+        if not line.strip():
+            break
+        _pending.append(("suggestion", line))
+        count += 1
+    if count:
+        flush_pending()
+    else:
+        print("No suggestions entered.")
+
+def process_suggestion(translated):
+    """Analyze, store and categorize an already translated suggestion."""
     sentiment = analyze_sentiment(translated)
     suggestion_entry = {"text": translated, "sentiment": sentiment}
-    suggestions.append(suggestion_entry)
     save_suggestion(suggestion_entry)
-    category = categorize_suggestion(translated)
+    code = categorize_suggestion(suggestion_entry)
     print(f"\nSuggestion (translated): {translated}")
     print(f"Sentiment: {sentiment}")
-    print(f"Categorized under: {category}")
+    print(f"Categorized under: {CATEGORY_NAMES[code]}")
 
 def add_question():
-    """Handle anonymous question input and processing."""
+    """Queue an anonymous question for batched translation."""
     question = input("Enter your anonymous question: ")
-    translated_q = detect_and_translate(question)
-    if translated_q not in questions:
-        questions[translated_q] = []
+    _pending.append(("question", question))
+    print("Question received.")
+    if len(_pending) >= PENDING_BATCH_SIZE:
+        flush_pending()
+
+def process_question(translated_q):
+    """Store an already translated question unless it already exists."""
+    entry = {'display': translated_q, 'answers': []}
+    # Single dict probe: setdefault only returns our new entry if the key was not there yet
+    if questions.setdefault(_normalize_question(translated_q), entry) is entry:
         save_question(translated_q)
         print("Question saved successfully.")
     else:
         print("This question already exists.")
 
+def flush_pending():
+    """Translate all queued submissions in one batch and process them in order."""
+    if not _pending:
+        return
+    batch = _pending[:]
+    _pending.clear()
+    translated = detect_and_translate_batch([text for _, text in batch])
+    for (kind, _), text in zip(batch, translated):
+        if kind == "suggestion":
+            process_suggestion(text)
+        else:
+            process_question(text)
+
+def _shutdown():
+    """Save any queued submissions, then flush, sync and close the data files."""
+    try:
+        flush_pending()
+    finally:
+        _close_files()
+
+def _shutdown_at_exit():
+    """atexit hook: like _shutdown, but translating without threads, which can no longer be started."""
+    global _exiting
+    _exiting = True
+    _shutdown()
+
+# Queued submissions and buffered appends must reach the disk even if the program
+# exits unexpectedly (end of input, Ctrl-C); translation failures keep the original text
+atexit.register(_shutdown_at_exit)
+
 def list_questions():
     """List all questions; view and add answers."""
+    try:
+        _browse_questions()
+    finally:
+        # Answers added while browsing stay buffered and reach the file together, in one write
+        _flush_file(QUESTIONS_FILE)
+
+def _browse_questions():
+    """Interactive loop behind list_questions."""
     if not questions:
         print("\nNo questions submitted yet.")
         return
 
+    # Adding answers never changes the keys, so the list only needs building once
+    q_list = list(questions.keys())
     while True:
         print("\nList of Questions:")
-        q_list = list(questions.keys())
-        for idx, q in enumerate(q_list, 1):
-            print(f"{idx}. {q}")
+        for idx, key in enumerate(q_list, 1):
+            print(f"{idx}. {questions[key]['display']}")
 
         choice = input("Enter question number to view answers or 0 to return: ").strip()
         if not choice.isdigit():
@@ -217,8 +702,8 @@ def list_questions():
         if num == 0:
             break
         if 1 <= num <= len(q_list):
-            q = q_list[num - 1]
-            answers = questions[q]
+            q = questions[q_list[num - 1]]['display']
+            answers = questions[q_list[num - 1]]['answers']
             print(f"\nAnswers for: {q}")
             if answers:
                 for i, ans in enumerate(answers, 1):
@@ -230,7 +715,7 @@ def list_questions():
                 add_ans = input("Add an answer? (yes/no): ").strip().lower()
                 if add_ans == 'yes':
                     new_ans = input("Enter your answer: ")
-                    questions[q].append(new_ans)
+                    answers.append(new_ans)
                     save_question(q, new_ans)
                     print("Answer added.")
                     break
@@ -244,8 +729,8 @@ def list_questions():
 def view_summary():
     """Show counts of suggestions per category."""
     print("\nSuggestion Summary:")
-    for category, items in categories.items():
-        print(f"{category}: {len(items)}")
+    for code, category in enumerate(CATEGORY_NAMES):
+        print(f"{category}: {len(category_members[code])}")
 
 def view_suggestions_by_category():
     """
@@ -254,13 +739,13 @@ def view_suggestions_by_category():
     For the chosen category, lists all suggestions with their associated sentiment (Positive, Neutral, Negative).
     Handles invalid inputs gracefully and allows the user to return to the previous menu.
     """
-    categories_list = list(categories.keys())
+    categories_list = CATEGORY_NAMES
     print("\nCategories and suggestion counts:")
     print("{:<5} {:<15} {}".format("No.", "Category", "Suggestion Count"))
     print("-" * 35)
+    # Walk CATEGORY_NAMES rather than category_members so the order never changes
     for i, cat in enumerate(categories_list, 1):
-        count = len(categories[cat])
-        print(f"{i:<5} {cat:<15} {count}")
+        print(f"{i:<5} {cat:<15} {len(category_members[i - 1])}")
     choice = input(f"\nChoose a category to view suggestions (1-{len(categories_list)}), or 0 to return: ").strip()
     if not choice.isdigit():
         print("Please enter a valid number.")
@@ -270,17 +755,11 @@ def view_suggestions_by_category():
         return
     if 1 <= choice_num <= len(categories_list):
         selected_cat = categories_list[choice_num - 1]
-        suggestions_in_cat = categories[selected_cat]
+        suggestions_in_cat = category_members[choice_num - 1]
         if suggestions_in_cat:
             print(f"\nSuggestions under '{selected_cat}':")
-            for i, suggestion_entry in enumerate(suggestions_in_cat, 1):
-                # Find sentiment from main suggestions list by matching text
-                sentiment = "Unknown"
-                for sug in suggestions:
-                    if sug['text'] == suggestion_entry['text']:
-                        sentiment = sug.get('sentiment', 'Unknown')
-                        break
-                print(f"{i}. {suggestion_entry['text']} (Sentiment: {sentiment})")
+            for i, index in enumerate(suggestions_in_cat, 1):
+                print(f"{i}. {suggestion_texts[index]} (Sentiment: {suggestion_sentiments[index]})")
         else:
             print(f"\nNo suggestions yet under '{selected_cat}'.")
     else:
@@ -288,76 +767,124 @@ def view_suggestions_by_category():
 
 # ------------------- Admin Functions -------------------
 
+def confirm_delete_all_data():
+    """Ask for confirmation before deleting all stored data."""
+    confirm = input("Are you sure? This will delete all data. (yes/no): ").strip().lower()
+    if confirm == 'yes':
+        delete_all_data()
+    else:
+        print("Deletion cancelled.")
+
+def confirm_reprocess_suggestions():
+    """Ask for confirmation before re-processing every stored suggestion."""
+    confirm = input("Re-process all suggestions? This rewrites the suggestions file "
+                    "and may send every suggestion to be translated again. (yes/no): ").strip().lower()
+    if confirm == 'yes':
+        reprocess_suggestions()
+    else:
+        print("Re-processing cancelled.")
+
+def reprocess_suggestions():
+    """Re-translate, re-score and re-categorize every stored suggestion, then rewrite the file.
+
+    Picks up entries whose translation failed when they were submitted, and applies
+    any changes to the sentiment lexicon or category keywords to old suggestions.
+    """
+    if not suggestion_texts:
+        print("No suggestions to re-process.")
+        return
+    texts = detect_and_translate_batch(suggestion_texts)
+    entries = [{"text": text, "sentiment": sentiment}
+               for text, sentiment in zip(texts, analyze_sentiments(texts))]
+    _clear_suggestions()
+    categorize_suggestions(entries)
+    _close_files()  # the open append handle would keep writing to the replaced file
+    _atomic_write(SUGGESTIONS_FILE, map(_json_line, entries))
+    print(f"Re-processed {len(entries)} suggestions.")
+
+def compact_questions_menu():
+    """Compact the questions log and report how many questions it now holds."""
+    compact_questions()
+    print(f"Questions file compacted to {len(questions)} questions.")
+
+def _print_menu(dispatch):
+    """Print the numbered options of a dispatch table."""
+    for choice, (label, _) in dispatch.items():
+        print(f"{choice}. {label}")
+
+# Admin menu choice -> (label, handler); a handler of None leaves the admin menu
+_ADMIN_DISPATCH = {
+    '1': ("View Suggestion Summary", view_summary),
+    '2': ("List Questions and Answers", list_questions),
+    '3': ("Delete All Suggestions and Questions", confirm_delete_all_data),
+    '4': ("Exit Admin Menu", None),
+    '5': ("Re-process All Suggestions", confirm_reprocess_suggestions),
+    '6': ("Compact Questions File", compact_questions_menu),
+}
+
 def admin_menu():
     """Admin-only menu with password protection."""
     pw = getpass.getpass("Enter admin password: ")
-    if pw != ADMIN_PASSWORD:
+    # Compare digests in constant time so response timing reveals nothing about the password
+    if not hmac.compare_digest(_hash_password(pw), ADMIN_PASSWORD_HASH):
         print("Incorrect password. Access denied.")
         return
     while True:
         print("\n--- Admin Menu ---")
-        print("1. View Suggestion Summary")
-        print("2. List Questions and Answers")
-        print("3. Delete All Suggestions and Questions")
-        print("4. Exit Admin Menu")
-        choice = input("Choose an option (1-4): ").strip()
-        if choice == '1':
-            view_summary()
-        elif choice == '2':
-            list_questions()
-        elif choice == '3':
-            confirm = input("Are you sure? This will delete all data. (yes/no): ").strip().lower()
-            if confirm == 'yes':
-                delete_all_data()
-            else:
-                print("Deletion cancelled.")
-        elif choice == '4':
+        _print_menu(_ADMIN_DISPATCH)
+        choice = input(f"Choose an option (1-{len(_ADMIN_DISPATCH)}): ").strip()
+        if choice not in _ADMIN_DISPATCH:
+            print(f"Invalid choice. Enter 1-{len(_ADMIN_DISPATCH)}.")
+            continue
+        handler = _ADMIN_DISPATCH[choice][1]
+        if handler is None:
             break
-        else:
-            print("Invalid choice. Enter 1-4.")
+        handler()
 
 # ------------------- Main Loop -------------------
 
+# Main menu choice -> (label, handler); a handler of None exits the program
+_MAIN_DISPATCH = {
+    '1': ("Submit a Suggestion", add_suggestion),
+    '2': ("View Suggestion Summary", view_summary),
+    '3': ("View Suggestions by Category", view_suggestions_by_category),
+    '4': ("Submit a Question", add_question),
+    '5': ("List Questions and View/Add Answers", list_questions),
+    '6': ("Exit", None),
+    '7': ("Admin Mode", admin_menu),
+    '8': ("Submit Several Suggestions at Once", add_suggestions_bulk),
+}
+
 def main():
     # Load persisted data on program start
     load_suggestions()
     load_questions()
+    load_translation_cache()
 
     while True:
+        flush_pending()
+        flush_files()
         print("\nMini Virtual Suggestion Box Menu")
-        print("1. Submit a Suggestion")
-        print("2. View Suggestion Summary")
-        print("3. View Suggestions by Category")  # updated menu text
-        print("4. Submit a Question")
-        print("5. List Questions and View/Add Answers")
-        print("6. Exit")
-        print("7. Admin Mode")
-
-        choice = input("Choose an option (1-7): ").strip()
-
-        if choice == '1':
-            add_suggestion()
-        elif choice == '2':
-            view_summary()
-        elif choice == '3':
-            view_suggestions_by_category()
-        elif choice == '4':
-            add_question()
-        elif choice == '5':
-            list_questions()
-        elif choice == '6':
-            print("Thank you for using the Suggestion Box. Goodbye!")
-            break
-        elif choice == '7':
-            admin_menu()
+        _print_menu(_MAIN_DISPATCH)
+
+        choice = input(f"Choose an option (1-{len(_MAIN_DISPATCH)}): ").strip()
+
+        if choice in _MAIN_DISPATCH:
+            handler = _MAIN_DISPATCH[choice][1]
+            if handler is None:
+                _shutdown()
+                print("Thank you for using the Suggestion Box. Goodbye!")
+                break
+            handler()
         else:
-            print("Invalid input. Please enter a number from 1 to 7.")
+            print(f"Invalid input. Please enter a number from 1 to {len(_MAIN_DISPATCH)}.")
 
         while True:
             cont = input("\nWould you like to return to the Main Menu? (yes/no): ").strip().lower()
             if cont == 'yes':
                 break
             elif cont == 'no':
+                _shutdown()
                 print("Thank you for using the Suggestion Box. Goodbye!")
                 return
             else: